@@ -1,16 +1,20 @@
-from flask import Flask, make_response
+import json
+
+from flask import Flask, Response
 
 app = Flask(__name__)
 
+# The body never changes, so serialize it once instead of on every request
+_HELLO_BODY = json.dumps(
+    {
+        'response': 'Hello, World!',
+        'status': 200
+    }
+)
+
 @app.route('/')
 def hello():
-    response = make_response(
-        {
-            'response': 'Hello, World!',
-            'status': 200
-        }
-    )
-    return response
+    return Response(_HELLO_BODY, mimetype='application/json')
 
 if __name__ == '__main__':
     # By default flask is only accessible from localhost.
@@ -5,7 +5,7 @@ from flask import Flask, jsonify, make_response, Response, request
 from boxing.models import boxers_model
 from boxing.models.ring_model import RingModel
 from boxing.utils.logger import configure_logger
-from boxing.utils.sql_utils import check_database_connection, check_table_exists
+from boxing.utils.sql_utils import check_database_connection, check_table_exists, migrate_database
 
 
 load_dotenv()
@@ -20,6 +20,9 @@ app = Flask(__name__)
 ring_model = RingModel()
 configure_logger(app.logger)
 
+# Bring a database created by an older init_db.sql up to the current schema
+migrate_database()
+
 
 ####################################################
 #
@@ -477,12 +480,13 @@ def get_leaderboard() -> Response:
 
     Query Parameters:
         - sort (str): The field to sort by ('wins', or 'win_pct'). Default is 'wins'.
+        - limit (int, optional): The maximum number of boxers to return. Default is all boxers.
 
     Returns:
         JSON response with a sorted leaderboard of boxers.
 
     Raises:
-        400 error if an invalid sort parameter is provided.
+        400 error if an invalid sort or limit parameter is provided.
         500 error if there is an issue generating the leaderboard.
 
     """
@@ -499,9 +503,26 @@ def get_leaderboard() -> Response:
                 "message": f"Invalid sort parameter '{sort_by}'. Must be one of: {', '.join(valid_sort_fields)}"
             }), 400)
 
+        # Parse limit explicitly; type=int would silently turn '?limit=abc' into no limit
+        limit_arg = request.args.get('limit')
+        limit = None
+
+        if limit_arg is not None:
+            try:
+                limit = int(limit_arg)
+            except ValueError:
+                limit = 0
+
+            if limit <= 0:
+                app.logger.warning(f"Invalid limit parameter: '{limit_arg}'")
+                return make_response(jsonify({
+                    "status": "error",
+                    "message": f"Invalid limit parameter '{limit_arg}'. Must be a positive integer"
+                }), 400)
+
         app.logger.info(f"Generating leaderboard sorted by '{sort_by}'")
 
-        leaderboard_data = boxers_model.get_leaderboard(sort_by)
+        leaderboard_data = boxers_model.get_leaderboard(sort_by, limit)
 
         app.logger.info(f"Leaderboard generated successfully. {len(leaderboard_data)} boxers ranked.")
 
@@ -1,7 +1,11 @@
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
 import logging
+import os
 import sqlite3
-from typing import Any, List
+import time
+from typing import Any, List, Optional
 
 from boxing.utils.sql_utils import get_db_connection
 from boxing.utils.logger import configure_logger
@@ -11,22 +15,124 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
-@dataclass
-class Boxer:
+# Leaderboards are cached for LEADERBOARD_TTL seconds, or until the next write to boxers.
+# There is one entry per sort order holding the full ranking; limits are served by slicing it.
+LEADERBOARD_TTL = int(os.getenv("LEADERBOARD_TTL", "30"))
+
+# Maximum number of boxers remembered by each of get_boxer_by_id and get_boxer_by_name
+BOXER_CACHE_SIZE = int(os.getenv("BOXER_CACHE_SIZE", "1024"))
+
+# Part of every cached lookup's key; delete_boxer bumps it so earlier lookups are never served
+_BOXER_VERSION = 0
+
+# sort_by -> (monotonic time stored, _LB_VERSION when queried, raw rows)
+_LB_CACHE: dict[str, tuple[float, int, tuple[tuple, ...]]] = {}
+_LB_VERSION = 0
+
+
+# SQL is kept in module-level constants so every call sends identical text and hits the
+# connection's prepared statement cache instead of being parsed and planned again
+_SQL_INSERT_BOXER = """
+    INSERT INTO boxers (name, weight, height, reach, age)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_DELETE_BOXER = "DELETE FROM boxers WHERE id = ?"
+_SQL_SELECT_BY_ID = """
+    SELECT id, name, weight, height, reach, age, weight_class
+    FROM boxers WHERE id = ?
+"""
+_SQL_SELECT_BY_NAME = """
+    SELECT id, name, weight, height, reach, age, weight_class
+    FROM boxers WHERE name = ?
+"""
+_SQL_RECORD_WIN = "UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?"
+_SQL_RECORD_LOSS = "UPDATE boxers SET fights = fights + 1 WHERE id = ?"
+_SQL_RECORD_FIGHT = """
+    UPDATE boxers
+    SET fights = fights + 1,
+        wins = wins + CASE WHEN id = ? THEN 1 ELSE 0 END
+    WHERE id IN (?, ?)
+"""
+
+# Weight class is a stored column and the win ratio is computed by SQLite; only the
+# conversion to a rounded percentage is left to _leaderboard_entry.
+# The leaderboard indexes are in rank order, so SQLite reads boxers ranked instead of sorting.
+_SQL_LEADERBOARD_SELECT = """
+    SELECT id, name, weight, height, reach, age, weight_class, fights, wins,
+           wins * 1.0 / fights AS win_ratio
+    FROM boxers
+    WHERE fights > 0
+"""
+# Keys of each leaderboard entry, in the order _SQL_LEADERBOARD_SELECT returns the columns
+# (win_ratio is stored under 'win_pct' and converted by _leaderboard_entry)
+_LEADERBOARD_COLUMNS = (
+    'id', 'name', 'weight', 'height', 'reach', 'age', 'weight_class', 'fights', 'wins', 'win_pct'
+)
+_SQL_LEADERBOARD = {
+    "wins": _SQL_LEADERBOARD_SELECT + " ORDER BY wins DESC",
+    "win_pct": _SQL_LEADERBOARD_SELECT + " ORDER BY (wins * 1.0 / fights) DESC",
+}
+
+
+# Lower weight bound of each class, lightest first (must stay in sync with init_db.sql)
+_WEIGHT_CLASS_THRESHOLDS = (125, 133, 166, 203)
+_WEIGHT_CLASS_NAMES = ('FEATHERWEIGHT', 'LIGHTWEIGHT', 'MIDDLEWEIGHT', 'HEAVYWEIGHT')
+
+
+def _invalidate_leaderboard() -> None:
+    global _LB_VERSION
+    _LB_VERSION += 1
+    _LB_CACHE.clear()
+
+
+def _invalidate_boxers() -> None:
+    global _BOXER_VERSION
+    _BOXER_VERSION += 1
+    # Entries under the old version can never be hit again, so free them
+    _get_boxer_by_id_cached.cache_clear()
+    _get_boxer_by_name_cached.cache_clear()
+
+
+class _BoxerSlots:
+    # Values Boxer precomputes in __post_init__. They are slots rather than dataclass fields
+    # so they stay out of repr(), equality and the JSON returned by the API.
+    __slots__ = ('_fighting_skill',)
+
+
+# Frozen, so the instances returned by the cached lookups can be shared safely
+@dataclass(frozen=True, slots=True)
+class Boxer(_BoxerSlots):
+    # id and name identify a boxer; the rest is fixed at insert, so equality and hashing skip it
     id: int
     name: str
-    weight: int
-    height: int
-    reach: float
-    age: int
-    weight_class: str = None
+    weight: int = field(compare=False)
+    height: int = field(compare=False)
+    reach: float = field(compare=False)
+    age: int = field(compare=False)
+    weight_class: str = field(default=None, compare=False)
 
     def __post_init__(self):
-        self.weight_class = get_weight_class(self.weight)  # Automatically assign weight class
+        # The dataclass is frozen, so derived values are set with object.__setattr__
 
+        # Rows loaded from the database already carry their stored weight class
+        if self.weight_class is None:
+            object.__setattr__(self, 'weight_class', get_weight_class(self.weight))  # Automatically assign weight class
 
-def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
+        # Fighting skill only depends on fields that never change, so compute it once per boxer
+        age_modifier = -1 if self.age < 25 else (-2 if self.age > 35 else 0)
+        object.__setattr__(self, '_fighting_skill', (self.weight * len(self.name)) + (self.reach / 10) + age_modifier)
+
+    @property
+    def fighting_skill(self) -> float:
+        return self._fighting_skill
+
+    def __reduce__(self):
+        # copy and pickle rebuild the boxer through the constructor, so __post_init__ fills the
+        # derived slots again; the generated slots state would only restore the fields
+        return (type(self), (self.id, self.name, self.weight, self.height, self.reach, self.age, self.weight_class))
 
+
+def _validate_boxer(weight: int, height: int, reach: float, age: int) -> None:
     if weight < 125:
         raise ValueError(f"Invalid weight: {weight}. Must be at least 125.")
     if height <= 0:
@@ -36,22 +142,22 @@ def create_boxer(name: str, weight: int, height: int, reach: float, age: int) ->
     if not (18 <= age <= 40):
         raise ValueError(f"Invalid age: {age}. Must be between 18 and 40.")
 
+
+def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
+
+    _validate_boxer(weight, height, reach, age)
+
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if the boxer already exists (name must be unique)
-            cursor.execute("SELECT 1 FROM boxers WHERE name = ?", (name,))
-            if cursor.fetchone():
-                raise ValueError(f"Boxer with name '{name}' already exists")
-
-            cursor.execute("""
-                INSERT INTO boxers (name, weight, height, reach, age)
-                VALUES (?, ?, ?, ?, ?)
-            """, (name, weight, height, reach, age))
+            # The UNIQUE constraint on name rejects duplicates, see the IntegrityError handler below
+            cursor.execute(_SQL_INSERT_BOXER, (name, weight, height, reach, age))
 
             conn.commit()
 
+        _invalidate_leaderboard()
+
     except sqlite3.IntegrityError:
         raise ValueError(f"Boxer with name '{name}' already exists")
 
@@ -59,80 +165,110 @@ def create_boxer(name: str, weight: int, height: int, reach: float, age: int) ->
         raise e
 
 
-def delete_boxer(boxer_id: int) -> None:
+def create_boxers_bulk(rows: List[tuple]) -> None:
+    # Rows are (name, weight, height, reach, age) tuples; either all of them are added or none are
+    for _, weight, height, reach, age in rows:
+        _validate_boxer(weight, height, reach, age)
+
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
-            if cursor.fetchone() is None:
-                raise ValueError(f"Boxer with ID {boxer_id} not found.")
+            # One prepared INSERT for every row, all inside a single transaction and commit
+            cursor.executemany(_SQL_INSERT_BOXER, rows)
 
-            cursor.execute("DELETE FROM boxers WHERE id = ?", (boxer_id,))
             conn.commit()
 
-    except sqlite3.Error as e:
-        raise e
+        _invalidate_leaderboard()
 
+    except sqlite3.IntegrityError as e:
+        raise ValueError(f"Boxer names must be unique: {e}")
 
-def get_leaderboard(sort_by: str = "wins") -> List[dict[str, Any]]:
-    query = """
-        SELECT id, name, weight, height, reach, age, fights, wins,
-               (wins * 1.0 / fights) AS win_pct
-        FROM boxers
-        WHERE fights > 0
-    """
+    except sqlite3.Error as e:
+        raise e
 
-    if sort_by == "win_pct":
-        query += " ORDER BY win_pct DESC"
-    elif sort_by == "wins":
-        query += " ORDER BY wins DESC"
-    else:
-        raise ValueError(f"Invalid sort_by parameter: {sort_by}")
 
+def delete_boxer(boxer_id: int) -> None:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(query)
-            rows = cursor.fetchall()
 
-        leaderboard = []
-        for row in rows:
-            boxer = {
-                'id': row[0],
-                'name': row[1],
-                'weight': row[2],
-                'height': row[3],
-                'reach': row[4],
-                'age': row[5],
-                'weight_class': get_weight_class(row[2]),  # Calculate weight class
-                'fights': row[6],
-                'wins': row[7],
-                'win_pct': round(row[8] * 100, 1)  # Convert to percentage
-            }
-            leaderboard.append(boxer)
-
-        return leaderboard
+            cursor.execute(_SQL_DELETE_BOXER, (boxer_id,))
+            if cursor.rowcount == 0:
+                raise ValueError(f"Boxer with ID {boxer_id} not found.")
+
+            conn.commit()
+
+        _invalidate_leaderboard()
+        _invalidate_boxers()
 
     except sqlite3.Error as e:
         raise e
 
 
+def _leaderboard_entry(row: tuple) -> dict[str, Any]:
+    entry = dict(zip(_LEADERBOARD_COLUMNS, row))
+    # Python's round() keeps the API's existing values; SQLite's ROUND() rounds halves away
+    # from zero, e.g. 1 win in 16 fights would become 6.3 instead of 6.2
+    entry['win_pct'] = round(entry['win_pct'] * 100, 1)  # Convert to percentage
+    return entry
+
+
+def get_leaderboard(sort_by: str = "wins", limit: Optional[int] = None) -> List[dict[str, Any]]:
+    query = _SQL_LEADERBOARD.get(sort_by)
+    if query is None:
+        raise ValueError(f"Invalid sort_by parameter: {sort_by}")
+
+    if limit is not None and limit <= 0:
+        raise ValueError(f"Invalid limit: {limit}. Must be greater than 0.")
+
+    # Rows are cached as tuples and every caller gets freshly built dicts, so no caller can
+    # change what the next one sees. A result read before a write carries the old version
+    # and is ignored, even if it was stored after the write invalidated the cache.
+    version = _LB_VERSION
+    cached = _LB_CACHE.get(sort_by)
+    if cached is not None and cached[1] == version and time.monotonic() - cached[0] < LEADERBOARD_TTL:
+        rows = cached[2]
+    else:
+        try:
+            with get_db_connection(readonly=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute(query)
+                rows = tuple(cursor.fetchall())
+
+        except sqlite3.Error as e:
+            raise e
+
+        _LB_CACHE[sort_by] = (time.monotonic(), version, rows)
+
+    return [_leaderboard_entry(row) for row in rows[:limit]]
+
+
+# Lookups are cached; the columns they return never change after insert, so only deleting
+# a boxer can make an entry stale (misses raise and are never cached). The version is taken
+# before the query, so a row read just before a delete is filed under the old version even
+# if the lookup only returns after delete_boxer has cleared the cache.
 def get_boxer_by_id(boxer_id: int) -> Boxer:
+    return _get_boxer_by_id_cached(boxer_id, _BOXER_VERSION)
+
+
+def get_boxer_by_name(boxer_name: str) -> Boxer:
+    return _get_boxer_by_name_cached(boxer_name, _BOXER_VERSION)
+
+
+@lru_cache(maxsize=BOXER_CACHE_SIZE)
+def _get_boxer_by_id_cached(boxer_id: int, version: int) -> Boxer:
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, weight, height, reach, age
-                FROM boxers WHERE id = ?
-            """, (boxer_id,))
+            cursor.execute(_SQL_SELECT_BY_ID, (boxer_id,))
 
             row = cursor.fetchone()
 
             if row:
                 boxer = Boxer(
                     id=row[0], name=row[1], weight=row[2], height=row[3],
-                    reach=row[4], age=row[5]
+                    reach=row[4], age=row[5], weight_class=row[6]
                 )
                 return boxer
             else:
@@ -142,21 +278,19 @@ def get_boxer_by_id(boxer_id: int) -> Boxer:
         raise e
 
 
-def get_boxer_by_name(boxer_name: str) -> Boxer:
+@lru_cache(maxsize=BOXER_CACHE_SIZE)
+def _get_boxer_by_name_cached(boxer_name: str, version: int) -> Boxer:
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, weight, height, reach, age
-                FROM boxers WHERE name = ?
-            """, (boxer_name,))
+            cursor.execute(_SQL_SELECT_BY_NAME, (boxer_name,))
 
             row = cursor.fetchone()
 
             if row:
                 boxer = Boxer(
                     id=row[0], name=row[1], weight=row[2], height=row[3],
-                    reach=row[4], age=row[5]
+                    reach=row[4], age=row[5], weight_class=row[6]
                 )
                 return boxer
             else:
@@ -166,19 +300,49 @@ def get_boxer_by_name(boxer_name: str) -> Boxer:
         raise e
 
 
+def get_boxers_by_ids(boxer_ids: List[int]) -> List[Boxer]:
+    if not boxer_ids:
+        return []
+
+    # Fetch every requested boxer in one round trip instead of one SELECT per id
+    placeholders = ", ".join("?" * len(boxer_ids))
+
+    try:
+        with get_db_connection(readonly=True) as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT id, name, weight, height, reach, age, weight_class
+                FROM boxers WHERE id IN ({placeholders})
+            """, tuple(boxer_ids))
+
+            rows = cursor.fetchall()
+
+        boxers = {
+            row[0]: Boxer(
+                id=row[0], name=row[1], weight=row[2], height=row[3],
+                reach=row[4], age=row[5], weight_class=row[6]
+            )
+            for row in rows
+        }
+
+        missing = [boxer_id for boxer_id in boxer_ids if boxer_id not in boxers]
+        if missing:
+            raise ValueError(f"Boxers with IDs {missing} not found.")
+
+        # Return boxers in the order they were requested
+        return [boxers[boxer_id] for boxer_id in boxer_ids]
+
+    except sqlite3.Error as e:
+        raise e
+
+
 def get_weight_class(weight: int) -> str:
-    if weight >= 203:
-        weight_class = 'HEAVYWEIGHT'
-    elif weight >= 166:
-        weight_class = 'MIDDLEWEIGHT'
-    elif weight >= 133:
-        weight_class = 'LIGHTWEIGHT'
-    elif weight >= 125:
-        weight_class = 'FEATHERWEIGHT'
-    else:
+    # Index of the heaviest threshold the weight reaches; -1 means it is below the lightest class
+    index = bisect_right(_WEIGHT_CLASS_THRESHOLDS, weight) - 1
+    if index < 0:
         raise ValueError(f"Invalid weight: {weight}. Weight must be at least 125.")
 
-    return weight_class
+    return _WEIGHT_CLASS_NAMES[index]
 
 
 def update_boxer_stats(boxer_id: int, result: str) -> None:
@@ -189,16 +353,42 @@ def update_boxer_stats(boxer_id: int, result: str) -> None:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
-            if cursor.fetchone() is None:
-                raise ValueError(f"Boxer with ID {boxer_id} not found.")
-
             if result == 'win':
-                cursor.execute("UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?", (boxer_id,))
+                cursor.execute(_SQL_RECORD_WIN, (boxer_id,))
             else:  # result == 'loss'
-                cursor.execute("UPDATE boxers SET fights = fights + 1 WHERE id = ?", (boxer_id,))
+                cursor.execute(_SQL_RECORD_LOSS, (boxer_id,))
+
+            # No rows touched means the boxer doesn't exist
+            if cursor.rowcount == 0:
+                raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
             conn.commit()
 
+        _invalidate_leaderboard()
+
+    except sqlite3.Error as e:
+        raise e
+
+
+def update_two_boxers_stats(winner_id: int, loser_id: int) -> None:
+    # A single row would get one fight instead of two, so a boxer can't fight themselves
+    if winner_id == loser_id:
+        raise ValueError(f"Winner and loser must be different boxers, got ID {winner_id} for both.")
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            # Record the bout for both boxers in a single statement and a single commit
+            cursor.execute(_SQL_RECORD_FIGHT, (winner_id, winner_id, loser_id))
+
+            if cursor.rowcount < 2:
+                conn.rollback()
+                raise ValueError(f"Boxer with ID {winner_id} or {loser_id} not found.")
+
+            conn.commit()
+
+        _invalidate_leaderboard()
+
     except sqlite3.Error as e:
         raise e
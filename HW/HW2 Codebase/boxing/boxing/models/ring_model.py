@@ -1,8 +1,8 @@
 import logging
 import math
-from typing import List
+from typing import List, Optional
 
-from boxing.models.boxers_model import Boxer, update_boxer_stats
+from boxing.models.boxers_model import Boxer, update_two_boxers_stats
 from boxing.utils.logger import configure_logger
 from boxing.utils.api_utils import get_random
 
@@ -12,22 +12,25 @@ configure_logger(logger)
 
 
 class RingModel:
+    # The ring only ever holds two boxers, so keep them in two fixed slots rather than a list
+    __slots__ = ('_a', '_b')
+
     def __init__(self):
-        self.ring: List[Boxer] = []
+        self._a: Optional[Boxer] = None
+        self._b: Optional[Boxer] = None
 
     def fight(self) -> str:
-        if len(self.ring) < 2:
+        boxer_1, boxer_2 = self._a, self._b
+        if boxer_1 is None or boxer_2 is None:
             raise ValueError("There must be two boxers to start a fight.")
 
-        boxer_1, boxer_2 = self.get_boxers()
-
         skill_1 = self.get_fighting_skill(boxer_1)
         skill_2 = self.get_fighting_skill(boxer_2)
 
         # Compute the absolute skill difference
         # And normalize using a logistic function for better probability scaling
         delta = abs(skill_1 - skill_2)
-        normalized_delta = 1 / (1 + math.e ** (-delta))
+        normalized_delta = 1.0 / (1.0 + math.exp(-delta))
 
         random_number = get_random()
 
@@ -38,38 +41,32 @@ class RingModel:
             winner = boxer_2
             loser = boxer_1
 
-        update_boxer_stats(winner.id, 'win')
-        update_boxer_stats(loser.id, 'loss')
+        update_two_boxers_stats(winner.id, loser.id)
 
         self.clear_ring()
 
         return winner.name
 
     def clear_ring(self):
-        if not self.ring:
-            return
-        self.ring.clear()
+        self._a = None
+        self._b = None
 
     def enter_ring(self, boxer: Boxer):
         if not isinstance(boxer, Boxer):
             raise TypeError(f"Invalid type: Expected 'Boxer', got '{type(boxer).__name__}'")
 
-        if len(self.ring) >= 2:
+        if self._a is None:
+            self._a = boxer
+        elif self._b is None:
+            if boxer.id == self._a.id:
+                raise ValueError(f"Boxer '{boxer.name}' is already in the ring.")
+            self._b = boxer
+        else:
             raise ValueError("Ring is full, cannot add more boxers.")
 
-        self.ring.append(boxer)
-
     def get_boxers(self) -> List[Boxer]:
-        if not self.ring:
-            pass
-        else:
-            pass
-
-        return self.ring
+        return [boxer for boxer in (self._a, self._b) if boxer is not None]
 
     def get_fighting_skill(self, boxer: Boxer) -> float:
-        # Arbitrary calculations
-        age_modifier = -1 if boxer.age < 25 else (-2 if boxer.age > 35 else 0)
-        skill = (boxer.weight * len(boxer.name)) + (boxer.reach / 10) + age_modifier
-
-        return skill
+        # Arbitrary calculations, done once when the Boxer is created
+        return boxer.fighting_skill
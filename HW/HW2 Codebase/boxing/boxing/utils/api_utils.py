@@ -1,6 +1,13 @@
+from collections import deque
 import logging
 import os
+import secrets
+import threading
+from typing import List
+from urllib.parse import parse_qsl, urlparse
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from boxing.utils.logger import configure_logger
 
@@ -9,28 +16,112 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
+# Each request fetches a batch of numbers (num=100) that is served locally, one per fight
 RANDOM_ORG_URL = os.getenv("RANDOM_ORG_URL",
-                           "https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new")
+                           "https://www.random.org/decimal-fractions/?num=100&dec=2&col=1&format=plain&rnd=new")
 
+# Set to true to skip random.org entirely and draw fight outcomes from the OS random source
+USE_LOCAL_RNG = os.getenv("USE_LOCAL_RNG", "false").lower() == "true"
 
-def get_random() -> float:
+# Refill the buffer in the background once it drops below this many numbers
+RANDOM_REFILL_THRESHOLD = int(os.getenv("RANDOM_REFILL_THRESHOLD", "20"))
+
+# Split the URL once so each request only passes the base URL and a params dict
+_parsed_url = urlparse(RANDOM_ORG_URL)
+_RANDOM_ORG_BASE_URL = _parsed_url._replace(query="").geturl()
+_RANDOM_ORG_PARAMS = dict(parse_qsl(_parsed_url.query))
+_RANDOM_DECIMALS = int(_RANDOM_ORG_PARAMS.get("dec", 2))
+
+# A shared session keeps the TCP/TLS connection to random.org alive between fights
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+_buffer = deque()
+_buffer_ready = threading.Condition()
+_refilling = False
+
+# Used when USE_LOCAL_RNG is set or random.org can't be reached
+_local_rng = secrets.SystemRandom()
+
+
+def _local_random() -> float:
+    # Same grid as random.org's decimal fractions (0.00 to 0.99 for dec=2); rounding
+    # random() instead could produce 1.0
+    scale = 10 ** _RANDOM_DECIMALS
+    return _local_rng.randrange(scale) / scale
+
+
+def _fetch_random_batch() -> List[float]:
     try:
-        response = requests.get(RANDOM_ORG_URL, timeout=5)
+        response = _SESSION.get(_RANDOM_ORG_BASE_URL, params=_RANDOM_ORG_PARAMS, timeout=5)
 
         # Check if the request was successful
         response.raise_for_status()
 
-        random_number_str = response.text.strip()
+        random_number_strs = response.text.split()
 
         try:
-            random_number = float(random_number_str)
+            random_numbers = [float(random_number_str) for random_number_str in random_number_strs]
         except ValueError:
-            raise ValueError(f"Invalid response from random.org: {random_number_str}")
+            raise ValueError(f"Invalid response from random.org: {response.text.strip()}")
+
+        if not random_numbers:
+            raise ValueError("Invalid response from random.org: empty response")
 
-        return random_number
+        return random_numbers
 
     except requests.exceptions.Timeout:
         raise RuntimeError("Request to random.org timed out.")
 
     except requests.exceptions.RequestException as e:
         raise RuntimeError(f"Request to random.org failed: {e}")
+
+
+def _refill_buffer() -> None:
+    global _refilling
+
+    try:
+        random_numbers = _fetch_random_batch()
+        with _buffer_ready:
+            _buffer.extend(random_numbers)
+
+    except (RuntimeError, ValueError) as e:
+        logger.warning("Could not refill random numbers from random.org: %s", e)
+
+    finally:
+        with _buffer_ready:
+            _refilling = False
+            _buffer_ready.notify_all()
+
+
+def get_random() -> float:
+    global _refilling
+
+    if USE_LOCAL_RNG:
+        return _local_random()
+
+    with _buffer_ready:
+        if not _buffer and _refilling:
+            # Another thread is already fetching a batch, so wait for it instead of fetching again
+            _buffer_ready.wait_for(lambda: _buffer or not _refilling, timeout=5)
+
+        random_number = _buffer.popleft() if _buffer else None
+
+        start_refill = len(_buffer) < RANDOM_REFILL_THRESHOLD and not _refilling
+        if start_refill:
+            _refilling = True
+
+    if start_refill:
+        if random_number is None:
+            # Nothing buffered yet, so this call has to wait for random.org
+            _refill_buffer()
+            with _buffer_ready:
+                random_number = _buffer.popleft() if _buffer else None
+        else:
+            threading.Thread(target=_refill_buffer, daemon=True).start()
+
+    if random_number is None:
+        logger.warning("No random numbers available from random.org, using the local generator.")
+        random_number = _local_random()
+
+    return random_number
@@ -0,0 +1,116 @@
+import atexit
+from contextlib import contextmanager
+import logging
+import os
+import queue
+import sqlite3
+import threading
+
+from boxing.utils.logger import configure_logger
+
+
+logger = logging.getLogger(__name__)
+configure_logger(logger)
+
+
+# Total number of pooled connections: one writer plus (POOL_SIZE - 1) readers
+POOL_SIZE = max(int(os.getenv("SQL_POOL_SIZE", "4")), 2)
+
+# Seconds to wait for a free connection before giving up with an OperationalError
+POOL_TIMEOUT = float(os.getenv("SQL_POOL_TIMEOUT", "10"))
+
+# Large enough that every statement the models use stays prepared for the connection's lifetime
+STATEMENT_CACHE_SIZE = 256
+
+# Applied once to every new connection, before it enters the pool
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+_init_lock = threading.Lock()
+_writer = None
+_readers = None
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _init_pool(db_path: str) -> None:
+    global _writer, _readers
+
+    with _init_lock:
+        if _writer is not None:
+            return
+
+        logger.info("Opening %d pooled connections to %s", POOL_SIZE, db_path)
+
+        # A single writer serializes writes; readers are handed out most-recently-used first
+        writer = queue.Queue(maxsize=1)
+        writer.put(_connect(db_path))
+
+        readers = queue.LifoQueue(maxsize=POOL_SIZE - 1)
+        for _ in range(POOL_SIZE - 1):
+            readers.put(_connect(db_path))
+
+        _readers = readers
+        _writer = writer
+
+
+@contextmanager
+def acquire(db_path: str, readonly: bool = False):
+    if _writer is None:
+        _init_pool(db_path)
+
+    pool = _readers if readonly else _writer
+    try:
+        conn = pool.get(timeout=POOL_TIMEOUT)
+    except queue.Empty:
+        # Fail the request rather than hang when every connection stays checked out
+        # (e.g. nested use of the writer or a connection that was never returned)
+        kind = "reader" if readonly else "writer"
+        logger.error("No %s connection became free within %s seconds", kind, POOL_TIMEOUT)
+        raise sqlite3.OperationalError(f"Timed out waiting for a {kind} connection from the pool")
+
+    try:
+        yield conn
+    finally:
+        # Never hand a connection with an open transaction back to the pool
+        if conn.in_transaction:
+            conn.rollback()
+        pool.put(conn)
+
+
+def close_all() -> None:
+    global _writer, _readers
+
+    with _init_lock:
+        if _writer is None:
+            return
+
+        logger.info("Closing pooled connections")
+
+        # Only idle connections can be closed; one still checked out is closed when it is collected
+        for pool in (_writer, _readers):
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+        _writer = None
+        _readers = None
+
+
+# Closing the last connection checkpoints the WAL back into the database file
+atexit.register(close_all)
@@ -4,6 +4,7 @@ import os
 import sqlite3
 
 from boxing.utils.logger import configure_logger
+from boxing.utils.sql_pool import acquire
 
 
 logger = logging.getLogger(__name__)
@@ -48,13 +49,59 @@ def check_table_exists(tablename: str):
         raise Exception(error_message) from e
 
 @contextmanager
-def get_db_connection():
-    conn = None
+def get_db_connection(readonly: bool = False):
     try:
-        conn = sqlite3.connect(DB_PATH)
-        yield conn
+        # Connections are long-lived and shared through the pool, so don't close them here
+        with acquire(DB_PATH, readonly=readonly) as conn:
+            yield conn
+    except sqlite3.Error as e:
+        raise e
+
+
+# Schema changes made after the first release of init_db.sql. Databases kept on a volume are
+# not recreated when CREATE_DB=false, so these bring them up to date on startup.
+# SQLite can only add a VIRTUAL generated column to an existing table; new databases get the
+# STORED column from init_db.sql (thresholds must stay in sync with it).
+_ADDED_COLUMNS = (
+    ("weight_class", """
+        ALTER TABLE boxers ADD COLUMN weight_class TEXT GENERATED ALWAYS AS (
+            CASE
+                WHEN weight >= 203 THEN 'HEAVYWEIGHT'
+                WHEN weight >= 166 THEN 'MIDDLEWEIGHT'
+                WHEN weight >= 133 THEN 'LIGHTWEIGHT'
+                ELSE 'FEATHERWEIGHT'
+            END
+        ) VIRTUAL
+    """),
+)
+_INDEX_CHANGES = (
+    "DROP INDEX IF EXISTS idx_boxers_name",  # Duplicates the UNIQUE constraint's index
+    "CREATE INDEX IF NOT EXISTS idx_boxers_leader_wins ON boxers(wins DESC) WHERE fights > 0",
+    "CREATE INDEX IF NOT EXISTS idx_boxers_leader_pct ON boxers((wins * 1.0 / fights) DESC) WHERE fights > 0",
+)
+
+
+def migrate_database() -> None:
+    # Nothing to migrate until the database and its table have been created
+    if not os.path.exists(DB_PATH):
+        return
+
+    try:
+        with get_db_connection() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(boxers)")}
+            if not columns:
+                return
+
+            for column, ddl in _ADDED_COLUMNS:
+                if column not in columns:
+                    logger.info("Adding column %s to the boxers table", column)
+                    conn.execute(ddl)
+
+            for ddl in _INDEX_CHANGES:
+                conn.execute(ddl)
+
+            conn.commit()
+
     except sqlite3.Error as e:
+        logger.error("Database migration failed: %s", e)
         raise e
-    finally:
-        if conn:
-            conn.close()
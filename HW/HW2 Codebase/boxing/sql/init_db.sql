@@ -1,13 +1,23 @@
 DROP TABLE IF EXISTS boxers;
 CREATE TABLE boxers (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL UNIQUE,  -- UNIQUE also gives lookups by name an index
     weight REAL NOT NULL CHECK (weight > 0),
     height REAL NOT NULL CHECK (height > 0),
     reach REAL CHECK (reach > 0),
     age INTEGER NOT NULL CHECK (age >= 18 AND age <= 40),
     fights INTEGER DEFAULT 0 CHECK (fights >= 0),
-    wins INTEGER DEFAULT 0 CHECK (wins >= 0 AND wins <= fights)  -- Wins cannot exceed fights
+    wins INTEGER DEFAULT 0 CHECK (wins >= 0 AND wins <= fights),  -- Wins cannot exceed fights
+    weight_class TEXT GENERATED ALWAYS AS (  -- Computed once when the row is written
+        CASE
+            WHEN weight >= 203 THEN 'HEAVYWEIGHT'
+            WHEN weight >= 166 THEN 'MIDDLEWEIGHT'
+            WHEN weight >= 133 THEN 'LIGHTWEIGHT'
+            ELSE 'FEATHERWEIGHT'
+        END
+    ) STORED
 );
 
-CREATE UNIQUE INDEX idx_boxers_name ON boxers(name);
+-- Partial indexes so the leaderboard can read boxers in rank order instead of sorting the table
+CREATE INDEX idx_boxers_leader_wins ON boxers(wins DESC) WHERE fights > 0;
+CREATE INDEX idx_boxers_leader_pct ON boxers((wins * 1.0 / fights) DESC) WHERE fights > 0;
@@ -0,0 +1,66 @@
+from contextlib import contextmanager
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from boxing.models import boxers_model
+from boxing.utils import sql_pool
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "sql" / "init_db.sql"
+
+
+def _reset_model_caches():
+    boxers_model._invalidate_leaderboard()
+    boxers_model._invalidate_boxers()
+
+
+@pytest.fixture
+def fresh_pool(monkeypatch):
+    # Start every test with an empty pool so connections point at the test's database
+    monkeypatch.setattr(sql_pool, "_writer", None)
+    monkeypatch.setattr(sql_pool, "_readers", None)
+    yield
+    sql_pool.close_all()
+
+
+@pytest.fixture(scope="session")
+def memory_db():
+    # One in-memory database for the whole run; the schema is created once from init_db.sql
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.executescript(SCHEMA_PATH.read_text())
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def sql_trace(memory_db, mocker):
+    """Point the boxers model at the in-memory database and start from an empty table.
+
+    Yields a list that records every SQL statement sent to the database during the test.
+
+    """
+    @contextmanager
+    def mock_get_db_connection(readonly=False):
+        try:
+            yield memory_db
+        finally:
+            # Mirror the pool, which never hands back a connection mid-transaction
+            if memory_db.in_transaction:
+                memory_db.rollback()
+
+    mocker.patch("boxing.models.boxers_model.get_db_connection", mock_get_db_connection)
+    _reset_model_caches()
+
+    statements = []
+    memory_db.set_trace_callback(statements.append)
+
+    yield statements
+
+    memory_db.set_trace_callback(None)
+    memory_db.execute("DELETE FROM boxers")
+    memory_db.execute("DELETE FROM sqlite_sequence")
+    memory_db.commit()
+    _reset_model_caches()
+
@@ -0,0 +1,211 @@
+from collections import deque
+import threading
+import time
+
+import pytest
+import requests
+
+from boxing.utils import api_utils
+from boxing.utils.api_utils import get_random
+
+
+RANDOM_NUMBERS = [0.42, 0.17, 0.93, 0.05, 0.61]
+
+
+@pytest.fixture(autouse=True)
+def reset_random_buffer(monkeypatch):
+    # Every test starts with an empty buffer, no refill in flight, and random.org enabled
+    monkeypatch.setattr(api_utils, "_buffer", deque())
+    monkeypatch.setattr(api_utils, "_refilling", False)
+    monkeypatch.setattr(api_utils, "USE_LOCAL_RNG", False)
+
+
+@pytest.fixture
+def mock_random_org(mocker):
+    # Patch the shared session's get call with a response holding one batch of numbers
+    mock_response = mocker.Mock()
+    mock_response.text = "\n".join(str(number) for number in RANDOM_NUMBERS) + "\n"
+    mocker.patch.object(api_utils._SESSION, "get", return_value=mock_response)
+    return mock_response
+
+
+def wait_for_refill():
+    # Background refills run on a daemon thread; wait for the one in flight to finish
+    deadline = time.monotonic() + 5
+    while api_utils._refilling and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert not api_utils._refilling, "Expected the background refill to finish."
+
+
+######################################################
+#
+#    Fetching a batch
+#
+######################################################
+
+
+def test_fetch_random_batch(mock_random_org):
+    """Test parsing a batch of numbers from random.org.
+
+    """
+    assert api_utils._fetch_random_batch() == RANDOM_NUMBERS
+
+    api_utils._SESSION.get.assert_called_once_with(
+        api_utils._RANDOM_ORG_BASE_URL, params=api_utils._RANDOM_ORG_PARAMS, timeout=5
+    )
+
+
+def test_fetch_random_batch_invalid_response(mock_random_org):
+    """Test handling of an invalid response from random.org.
+
+    """
+    mock_random_org.text = "invalid_response"
+
+    with pytest.raises(ValueError, match="Invalid response from random.org: invalid_response"):
+        api_utils._fetch_random_batch()
+
+
+def test_fetch_random_batch_empty_response(mock_random_org):
+    """Test handling of an empty response from random.org.
+
+    """
+    mock_random_org.text = "\n"
+
+    with pytest.raises(ValueError, match="Invalid response from random.org: empty response"):
+        api_utils._fetch_random_batch()
+
+
+def test_fetch_random_batch_timeout(mocker):
+    """Test handling of a timeout when calling random.org.
+
+    """
+    mocker.patch.object(api_utils._SESSION, "get", side_effect=requests.exceptions.Timeout)
+
+    with pytest.raises(RuntimeError, match="Request to random.org timed out."):
+        api_utils._fetch_random_batch()
+
+
+######################################################
+#
+#    Serving from the buffer
+#
+######################################################
+
+
+def test_get_random_first_call_fetches(mock_random_org, mocker):
+    """Test that the first call waits for a batch and serves its first number.
+
+    """
+    mocker.patch.object(api_utils, "RANDOM_REFILL_THRESHOLD", 2)
+
+    assert get_random() == RANDOM_NUMBERS[0]
+    assert get_random() == RANDOM_NUMBERS[1]
+
+    api_utils._SESSION.get.assert_called_once()
+    assert list(api_utils._buffer) == RANDOM_NUMBERS[2:]
+
+
+def test_get_random_refills_below_threshold(mock_random_org, mocker):
+    """Test that dropping below RANDOM_REFILL_THRESHOLD starts a background refill.
+
+    """
+    mocker.patch.object(api_utils, "RANDOM_REFILL_THRESHOLD", 3)
+    api_utils._buffer.extend([0.11, 0.22, 0.33])
+
+    assert get_random() == 0.11
+    wait_for_refill()
+
+    api_utils._SESSION.get.assert_called_once()
+    assert list(api_utils._buffer) == [0.22, 0.33] + RANDOM_NUMBERS
+
+
+def test_get_random_no_refill_above_threshold(mock_random_org, mocker):
+    """Test that no request is made while the buffer holds enough numbers.
+
+    """
+    mocker.patch.object(api_utils, "RANDOM_REFILL_THRESHOLD", 1)
+    api_utils._buffer.extend([0.11, 0.22])
+
+    assert get_random() == 0.11
+
+    api_utils._SESSION.get.assert_not_called()
+
+
+def test_get_random_no_second_fetch_while_refilling(mock_random_org, mocker):
+    """Test that a call made while a refill is running doesn't start another one.
+
+    """
+    mocker.patch.object(api_utils, "RANDOM_REFILL_THRESHOLD", 10)
+    api_utils._buffer.extend([0.11, 0.22])
+    api_utils._refilling = True
+
+    assert get_random() == 0.11
+
+    api_utils._SESSION.get.assert_not_called()
+
+
+def test_get_random_waits_for_refill_in_flight(mock_random_org):
+    """Test that an empty buffer waits for the refill already in flight instead of fetching.
+
+    """
+    api_utils._refilling = True
+
+    def finish_refill():
+        time.sleep(0.05)
+        with api_utils._buffer_ready:
+            api_utils._buffer.append(0.77)
+            api_utils._refilling = False
+            api_utils._buffer_ready.notify_all()
+
+    refill = threading.Thread(target=finish_refill)
+    refill.start()
+
+    assert get_random() == 0.77
+
+    refill.join()
+    wait_for_refill()  # The empty buffer triggers the next refill in the background
+    api_utils._SESSION.get.assert_called_once()
+
+
+######################################################
+#
+#    Falling back to the local generator
+#
+######################################################
+
+
+@pytest.mark.parametrize("failure", ["timeout", "http_error", "bad_data"])
+def test_get_random_falls_back_to_local(mocker, caplog, failure):
+    """Test that a timeout, HTTP error, or bad data falls back to a locally drawn number.
+
+    """
+    mock_response = mocker.Mock()
+    mock_response.text = "invalid_response"
+    if failure == "http_error":
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("503 Server Error")
+    mock_get = mocker.patch.object(api_utils._SESSION, "get", return_value=mock_response)
+    if failure == "timeout":
+        mock_get.side_effect = requests.exceptions.Timeout
+
+    result = get_random()
+
+    assert 0 <= result < 1
+    assert result == round(result, api_utils._RANDOM_DECIMALS)
+    assert not api_utils._refilling, "Expected the failed refill to be cleared."
+    assert "using the local generator" in caplog.text
+
+
+def test_get_random_use_local_rng(mocker, monkeypatch):
+    """Test that USE_LOCAL_RNG draws numbers locally without ever calling random.org.
+
+    """
+    monkeypatch.setattr(api_utils, "USE_LOCAL_RNG", True)
+    mock_get = mocker.patch.object(api_utils._SESSION, "get")
+
+    results = [get_random() for _ in range(50)]
+
+    mock_get.assert_not_called()
+    assert not api_utils._refilling, "Expected no refill to be started."
+    for result in results:
+        assert 0 <= result < 1
+        assert result == round(result, api_utils._RANDOM_DECIMALS)
@@ -0,0 +1,517 @@
+from contextlib import contextmanager
+from dataclasses import FrozenInstanceError, asdict
+
+import pytest
+
+from boxing.models import boxers_model
+from boxing.models.boxers_model import (
+    _SQL_LEADERBOARD,
+    _SQL_SELECT_BY_NAME,
+    _LB_CACHE,
+    Boxer,
+    create_boxer,
+    create_boxers_bulk,
+    delete_boxer,
+    get_boxer_by_id,
+    get_boxer_by_name,
+    get_boxers_by_ids,
+    get_leaderboard,
+    get_weight_class,
+    update_boxer_stats,
+    update_two_boxers_stats
+)
+
+
+######################################################
+#
+#    Helpers
+#
+######################################################
+
+def commits(statements):
+    return [statement for statement in statements if statement == "COMMIT"]
+
+
+def add_sample_boxers():
+    create_boxers_bulk([
+        ("Boxer One", 150, 70, 70.5, 25),
+        ("Boxer Two", 180, 72, 72.0, 30),
+        ("Boxer Three", 210, 75, 78.0, 35),
+    ])
+
+
+######################################################
+#
+#    Add and delete
+#
+######################################################
+
+
+def test_create_boxer(sql_trace):
+    """Test creating a new boxer.
+
+    """
+    create_boxer(name="Boxer One", weight=150, height=70, reach=70.5, age=25)
+
+    boxer = get_boxer_by_name("Boxer One")
+
+    assert asdict(boxer) == asdict(Boxer(id=1, name="Boxer One", weight=150, height=70, reach=70.5, age=25))
+    assert boxer.weight_class == "LIGHTWEIGHT"
+    assert len(commits(sql_trace)) == 1, "Expected the boxer to be added with a single commit."
+
+
+def test_boxer_equality():
+    """Test that boxers compare and hash by id and name only.
+
+    """
+    boxer = Boxer(id=1, name="Boxer One", weight=150, height=70, reach=70.5, age=25)
+    same_boxer = Boxer(id=1, name="Boxer One", weight=151, height=71, reach=71.0, age=26)
+
+    assert boxer == same_boxer
+    assert hash(boxer) == hash(same_boxer)
+    assert boxer != Boxer(id=2, name="Boxer One", weight=150, height=70, reach=70.5, age=25)
+    assert boxer != Boxer(id=1, name="Boxer Two", weight=150, height=70, reach=70.5, age=25)
+
+
+def test_create_boxer_duplicate(sql_trace):
+    """Test creating a boxer with a duplicate name (should raise an error).
+
+    """
+    create_boxer(name="Boxer One", weight=150, height=70, reach=70.5, age=25)
+
+    with pytest.raises(ValueError, match="Boxer with name 'Boxer One' already exists"):
+        create_boxer(name="Boxer One", weight=180, height=72, reach=72.0, age=30)
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({"weight": 124}, "Invalid weight: 124. Must be at least 125."),
+    ({"height": 0}, "Invalid height: 0. Must be greater than 0."),
+    ({"reach": -1}, "Invalid reach: -1. Must be greater than 0."),
+    ({"age": 17}, "Invalid age: 17. Must be between 18 and 40."),
+    ({"age": 41}, "Invalid age: 41. Must be between 18 and 40."),
+])
+def test_create_boxer_invalid(sql_trace, kwargs, message):
+    """Test error when creating a boxer with an invalid weight, height, reach, or age.
+
+    """
+    boxer = {"name": "Boxer One", "weight": 150, "height": 70, "reach": 70.5, "age": 25, **kwargs}
+
+    with pytest.raises(ValueError, match=message):
+        create_boxer(**boxer)
+
+    assert sql_trace == [], "Expected invalid input to be rejected before touching the database."
+
+
+def test_create_boxers_bulk(sql_trace):
+    """Test adding several boxers in a single transaction.
+
+    """
+    add_sample_boxers()
+
+    assert [boxer.name for boxer in get_boxers_by_ids([1, 2, 3])] == ["Boxer One", "Boxer Two", "Boxer Three"]
+    assert sql_trace.count("BEGIN ") == 1, "Expected all rows to be inserted in one transaction."
+    assert len(commits(sql_trace)) == 1, "Expected all rows to be inserted with a single commit."
+
+
+def test_create_boxers_bulk_duplicate(sql_trace):
+    """Test that a duplicate name anywhere in the batch adds none of the boxers.
+
+    """
+    with pytest.raises(ValueError, match="Boxer names must be unique"):
+        create_boxers_bulk([("Boxer One", 150, 70, 70.5, 25), ("Boxer One", 180, 72, 72.0, 30)])
+
+    with pytest.raises(ValueError, match="Boxer 'Boxer One' not found."):
+        get_boxer_by_name("Boxer One")
+
+
+def test_create_boxers_bulk_invalid_row(sql_trace):
+    """Test that an invalid row is rejected before anything is written.
+
+    """
+    with pytest.raises(ValueError, match="Invalid age: 41. Must be between 18 and 40."):
+        create_boxers_bulk([("Boxer One", 150, 70, 70.5, 25), ("Boxer Two", 180, 72, 72.0, 41)])
+
+    assert sql_trace == [], "Expected no SQL to run for an invalid batch."
+
+
+def test_delete_boxer(sql_trace):
+    """Test deleting a boxer by ID.
+
+    """
+    add_sample_boxers()
+    get_boxer_by_id(1)  # Populate the lookup cache
+    sql_trace.clear()
+
+    delete_boxer(1)
+
+    statements = [statement for statement in sql_trace if statement not in ("BEGIN ", "COMMIT")]
+    assert len(statements) == 1, "Expected the boxer to be deleted with a single statement."
+    assert statements[0].startswith("DELETE FROM boxers")
+    assert len(commits(sql_trace)) == 1, "Expected the boxer to be deleted with a single commit."
+
+    with pytest.raises(ValueError, match="Boxer with ID 1 not found."):
+        get_boxer_by_id(1)
+
+
+def test_delete_boxer_during_lookup(sql_trace, mocker):
+    """Test that a lookup which read its row before a delete isn't served from the cache after it.
+
+    """
+    add_sample_boxers()
+    fixture_get_db_connection = boxers_model.get_db_connection
+
+    @contextmanager
+    def delete_after_read(readonly=False):
+        with fixture_get_db_connection(readonly) as conn:
+            yield conn
+        # The lookup has read boxer 1 but not yet returned (and been cached) when the delete commits
+        mocker.patch.object(boxers_model, "get_db_connection", fixture_get_db_connection)
+        delete_boxer(1)
+
+    mocker.patch.object(boxers_model, "get_db_connection", delete_after_read)
+
+    assert get_boxer_by_id(1).id == 1
+
+    with pytest.raises(ValueError, match="Boxer with ID 1 not found."):
+        get_boxer_by_id(1)
+
+
+def test_delete_boxer_bad_id(sql_trace):
+    """Test error when trying to delete a boxer that doesn't exist.
+
+    """
+    with pytest.raises(ValueError, match="Boxer with ID 999 not found."):
+        delete_boxer(999)
+
+    assert commits(sql_trace) == [], "Expected nothing to be committed for a missing boxer."
+
+
+######################################################
+#
+#    Get boxers
+#
+######################################################
+
+
+def test_get_boxer_by_id(sql_trace):
+    """Test getting a boxer by ID.
+
+    """
+    add_sample_boxers()
+
+    boxer = get_boxer_by_id(3)
+
+    assert asdict(boxer) == asdict(Boxer(id=3, name="Boxer Three", weight=210, height=75, reach=78.0, age=35))
+    assert boxer.weight_class == "HEAVYWEIGHT"
+
+
+def test_get_boxer_by_id_is_cached(sql_trace):
+    """Test that repeated lookups are served without another query.
+
+    """
+    add_sample_boxers()
+
+    first = get_boxer_by_id(1)
+    statements_after_first = len(sql_trace)
+    second = get_boxer_by_id(1)
+
+    assert second is first
+    assert len(sql_trace) == statements_after_first, "Expected the second lookup to skip the database."
+
+
+def test_cached_boxer_is_immutable(sql_trace):
+    """Test that a boxer shared by the lookup cache can't be modified.
+
+    """
+    add_sample_boxers()
+
+    with pytest.raises(FrozenInstanceError):
+        get_boxer_by_id(1).weight = 300
+
+    assert get_boxer_by_id(1).weight == 150
+
+
+def test_get_boxer_by_id_bad_id(sql_trace):
+    """Test error when getting a boxer that doesn't exist.
+
+    """
+    with pytest.raises(ValueError, match="Boxer with ID 999 not found."):
+        get_boxer_by_id(999)
+
+
+def test_get_boxer_by_name(sql_trace):
+    """Test getting a boxer by name.
+
+    """
+    add_sample_boxers()
+
+    boxer = get_boxer_by_name("Boxer Two")
+
+    assert asdict(boxer) == asdict(Boxer(id=2, name="Boxer Two", weight=180, height=72, reach=72.0, age=30))
+
+
+def test_get_boxer_by_name_bad_name(sql_trace):
+    """Test error when getting a boxer by a name that doesn't exist.
+
+    """
+    with pytest.raises(ValueError, match="Boxer 'Nobody' not found."):
+        get_boxer_by_name("Nobody")
+
+
+def test_get_boxers_by_ids(sql_trace):
+    """Test getting several boxers in one query, in the order requested.
+
+    """
+    add_sample_boxers()
+    sql_trace.clear()
+
+    boxers = get_boxers_by_ids([3, 1])
+
+    assert [boxer.id for boxer in boxers] == [3, 1]
+    assert len([statement for statement in sql_trace if statement.lstrip().startswith("SELECT")]) == 1
+
+
+def test_get_boxers_by_ids_bad_id(sql_trace):
+    """Test error when any of the requested boxers doesn't exist.
+
+    """
+    add_sample_boxers()
+
+    with pytest.raises(ValueError, match=r"Boxers with IDs \[999\] not found."):
+        get_boxers_by_ids([1, 999])
+
+
+@pytest.mark.parametrize("weight, expected", [
+    (125, "FEATHERWEIGHT"),
+    (132.9, "FEATHERWEIGHT"),
+    (133, "LIGHTWEIGHT"),
+    (166, "MIDDLEWEIGHT"),
+    (203, "HEAVYWEIGHT"),
+])
+def test_get_weight_class(weight, expected):
+    """Test the weight class boundaries.
+
+    """
+    assert get_weight_class(weight) == expected
+
+
+def test_get_weight_class_invalid():
+    """Test error when the weight is below the lightest weight class.
+
+    """
+    with pytest.raises(ValueError, match="Invalid weight: 124. Weight must be at least 125."):
+        get_weight_class(124)
+
+
+######################################################
+#
+#    Leaderboard
+#
+######################################################
+
+
+def test_get_leaderboard_by_wins(sql_trace):
+    """Test the leaderboard sorted by wins.
+
+    """
+    add_sample_boxers()
+    update_two_boxers_stats(winner_id=2, loser_id=1)
+    update_two_boxers_stats(winner_id=2, loser_id=3)
+    update_two_boxers_stats(winner_id=3, loser_id=1)
+
+    leaderboard = get_leaderboard("wins")
+
+    assert [boxer["name"] for boxer in leaderboard] == ["Boxer Two", "Boxer Three", "Boxer One"]
+    assert leaderboard[0] == {
+        "id": 2, "name": "Boxer Two", "weight": 180, "height": 72, "reach": 72.0, "age": 30,
+        "weight_class": "MIDDLEWEIGHT", "fights": 2, "wins": 2, "win_pct": 100.0
+    }
+
+
+def test_get_leaderboard_by_win_pct(sql_trace):
+    """Test the leaderboard sorted by win percentage, with a limit.
+
+    """
+    add_sample_boxers()
+    update_two_boxers_stats(winner_id=1, loser_id=2)
+    update_two_boxers_stats(winner_id=3, loser_id=1)
+    update_two_boxers_stats(winner_id=3, loser_id=2)
+
+    leaderboard = get_leaderboard("win_pct", limit=2)
+
+    assert [(boxer["name"], boxer["win_pct"]) for boxer in leaderboard] == [("Boxer Three", 100.0), ("Boxer One", 50.0)]
+
+
+def test_get_leaderboard_cache_is_bounded(sql_trace):
+    """Test that different limits share one cached ranking per sort order.
+
+    """
+    add_sample_boxers()
+    update_two_boxers_stats(winner_id=2, loser_id=1)
+    update_two_boxers_stats(winner_id=3, loser_id=1)
+    sql_trace.clear()
+
+    for limit in range(1, 20):
+        assert len(get_leaderboard("wins", limit=limit)) == min(limit, 3)
+
+    assert len(_LB_CACHE) == 1
+    assert len([statement for statement in sql_trace if statement.lstrip().startswith("SELECT")]) == 1
+
+
+def test_get_leaderboard_returns_copies(sql_trace):
+    """Test that changing a returned leaderboard doesn't change what the next caller gets.
+
+    """
+    add_sample_boxers()
+    update_two_boxers_stats(winner_id=2, loser_id=1)
+
+    leaderboard = get_leaderboard()
+    leaderboard[0]["wins"] = 100
+    leaderboard.clear()
+
+    assert [(boxer["id"], boxer["wins"]) for boxer in get_leaderboard()] == [(2, 1), (1, 0)]
+
+
+def test_get_leaderboard_win_pct_rounding(sql_trace):
+    """Test that win percentage keeps Python's rounding (6.25 rounds to 6.2, not 6.3).
+
+    """
+    add_sample_boxers()
+    update_boxer_stats(1, "win")
+    for _ in range(15):
+        update_boxer_stats(1, "loss")
+
+    assert get_leaderboard()[0]["win_pct"] == 6.2
+
+
+def test_get_leaderboard_skips_boxers_without_fights(sql_trace):
+    """Test that boxers who haven't fought are left off the leaderboard.
+
+    """
+    add_sample_boxers()
+
+    assert get_leaderboard() == []
+
+
+def test_get_leaderboard_refreshes_after_update(sql_trace):
+    """Test that a cached leaderboard is replaced once stats change.
+
+    """
+    add_sample_boxers()
+    update_boxer_stats(1, "win")
+    assert [boxer["wins"] for boxer in get_leaderboard()] == [1]
+
+    update_boxer_stats(1, "win")
+
+    assert [boxer["wins"] for boxer in get_leaderboard()] == [2]
+
+
+@pytest.mark.parametrize("query, params, index", [
+    (_SQL_SELECT_BY_NAME, ("Boxer One",), "USING INDEX sqlite_autoindex_boxers_1 (name=?)"),
+    (_SQL_LEADERBOARD["wins"], (), "USING INDEX idx_boxers_leader_wins"),
+    (_SQL_LEADERBOARD["win_pct"], (), "USING INDEX idx_boxers_leader_pct"),
+])
+def test_query_uses_index(memory_db, query, params, index):
+    """Test that name lookups and both leaderboard sorts are answered from an index.
+
+    """
+    plan = " ".join(row[3] for row in memory_db.execute(f"EXPLAIN QUERY PLAN {query}", params))
+
+    assert index in plan, f"Expected the query to use an index, got plan: {plan}"
+    assert "TEMP B-TREE" not in plan, "Expected no separate sort step."
+
+
+def test_invalid_leaderboard(sql_trace):
+    """Test error when the sort_by parameter is invalid.
+
+    """
+    with pytest.raises(ValueError, match="Invalid sort_by parameter: age"):
+        get_leaderboard("age")
+
+    assert sql_trace == [], "Expected the sort_by check to happen before any SQL runs."
+
+
+def test_invalid_leaderboard_limit(sql_trace):
+    """Test error when the limit is not positive.
+
+    """
+    with pytest.raises(ValueError, match="Invalid limit: 0. Must be greater than 0."):
+        get_leaderboard("wins", limit=0)
+
+
+######################################################
+#
+#    Update stats
+#
+######################################################
+
+
+@pytest.mark.parametrize("result, expected_wins", [("win", 1), ("loss", 0)])
+def test_update_boxer_stats(sql_trace, result, expected_wins):
+    """Test recording a win or loss with a single commit.
+
+    """
+    add_sample_boxers()
+    sql_trace.clear()
+
+    update_boxer_stats(1, result)
+
+    assert len(commits(sql_trace)) == 1
+    assert [(boxer["fights"], boxer["wins"]) for boxer in get_leaderboard()] == [(1, expected_wins)]
+
+
+def test_update_boxer_stats_bad_id(sql_trace):
+    """Test error when trying to update a boxer that doesn't exist.
+
+    """
+    with pytest.raises(ValueError, match="Boxer with ID 999 not found."):
+        update_boxer_stats(999, "win")
+
+    assert commits(sql_trace) == [], "Expected nothing to be committed for a missing boxer."
+
+
+def test_update_boxer_stats_invalid_result(sql_trace):
+    """Test error when the result is neither 'win' nor 'loss'.
+
+    """
+    with pytest.raises(ValueError, match="Invalid result: draw. Expected 'win' or 'loss'."):
+        update_boxer_stats(1, "draw")
+
+    assert sql_trace == []
+
+
+def test_update_two_boxers_stats(sql_trace):
+    """Test recording a bout for both boxers in one statement and one commit.
+
+    """
+    add_sample_boxers()
+    sql_trace.clear()
+
+    update_two_boxers_stats(winner_id=1, loser_id=2)
+
+    assert len(commits(sql_trace)) == 1
+    assert {boxer["id"]: (boxer["fights"], boxer["wins"]) for boxer in get_leaderboard()} == {1: (1, 1), 2: (1, 0)}
+
+
+def test_update_two_boxers_stats_bad_id(sql_trace):
+    """Test that nothing is recorded when one of the boxers doesn't exist.
+
+    """
+    add_sample_boxers()
+
+    with pytest.raises(ValueError, match="Boxer with ID 1 or 999 not found."):
+        update_two_boxers_stats(winner_id=1, loser_id=999)
+
+    assert get_leaderboard() == []
+
+
+def test_update_two_boxers_stats_same_boxer(sql_trace):
+    """Test that a boxer can't be recorded as both the winner and the loser of a bout.
+
+    """
+    add_sample_boxers()
+
+    with pytest.raises(ValueError, match="Winner and loser must be different boxers, got ID 1 for both."):
+        update_two_boxers_stats(winner_id=1, loser_id=1)
+
+    assert get_leaderboard() == []
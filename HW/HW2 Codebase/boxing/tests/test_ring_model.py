@@ -0,0 +1,163 @@
+import copy
+import pickle
+
+import pytest
+
+from boxing.models.ring_model import RingModel
+from boxing.models.boxers_model import Boxer
+
+
+@pytest.fixture
+def ring_model():
+    """Fixture to provide a new instance of RingModel for each test.
+
+    """
+    return RingModel()
+
+# Fixtures providing sample boxers. Boxer is frozen, so these are built once and shared.
+@pytest.fixture(scope="session")
+def sample_boxer1():
+    return Boxer(1, "Muhammad Ali", 210, 191, 78.0, 32)
+
+@pytest.fixture(scope="session")
+def sample_boxer2():
+    return Boxer(2, "Mike Tyson", 220, 178, 71.0, 24)
+
+@pytest.fixture(scope="session")
+def sample_boxers(sample_boxer1, sample_boxer2):
+    return [sample_boxer1, sample_boxer2]
+
+
+##########################################################
+# Boxer Prep
+##########################################################
+
+
+def test_add_boxer_to_ring(ring_model, sample_boxer1, sample_boxer2):
+    """Test that boxers are added to the ring in the order they enter.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+
+    assert ring_model.get_boxers() == [sample_boxer1], "Ring should contain one boxer after calling enter_ring."
+
+    ring_model.enter_ring(sample_boxer2)
+
+    assert ring_model.get_boxers() == [sample_boxer1, sample_boxer2], "Ring should contain both boxers, in order."
+
+def test_add_bad_boxer_to_ring(ring_model):
+    """Test that enter_ring raises a TypeError for anything that isn't a Boxer.
+
+    """
+    with pytest.raises(TypeError, match="Invalid type: Expected 'Boxer', got 'dict'"):
+        ring_model.enter_ring({"id": 1, "name": "Muhammad Ali"})
+
+    assert ring_model.get_boxers() == [], "Ring should still be empty."
+
+def test_full_ring(ring_model, sample_boxers, sample_boxer1):
+    """Test that enter_ring raises an error when the ring is full.
+
+    """
+    for boxer in sample_boxers:
+        ring_model.enter_ring(boxer)
+
+    with pytest.raises(ValueError, match="Ring is full, cannot add more boxers."):
+        ring_model.enter_ring(sample_boxer1)
+
+    assert ring_model.get_boxers() == sample_boxers, "Ring should still contain only 2 boxers after trying to add a third."
+
+def test_add_same_boxer_twice(ring_model, sample_boxer1):
+    """Test that a boxer can't take both places in the ring.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+
+    with pytest.raises(ValueError, match="Boxer 'Muhammad Ali' is already in the ring."):
+        ring_model.enter_ring(sample_boxer1)
+
+    assert ring_model.get_boxers() == [sample_boxer1], "Ring should still contain only the first boxer."
+
+def test_clear_ring(ring_model, sample_boxers):
+    """Test that clear_ring empties the ring.
+
+    """
+    for boxer in sample_boxers:
+        ring_model.enter_ring(boxer)
+
+    ring_model.clear_ring()
+
+    assert ring_model.get_boxers() == [], "Ring should be empty after calling clear_ring."
+
+def test_get_boxers_empty(ring_model):
+    """Test that get_boxers returns an empty list when there are no boxers.
+
+    """
+    assert ring_model.get_boxers() == [], "Expected get_boxers to return an empty list when there are no boxers."
+
+
+##########################################################
+# Fight
+##########################################################
+
+
+def test_get_fighting_skill(ring_model, sample_boxer1, sample_boxer2):
+    """Test the get_fighting_skill method.
+
+    """
+    expected_score_1 = (210 * 12) + (78 / 10)  # 210 * 12 + 7.8 = 2527.8
+    assert ring_model.get_fighting_skill(sample_boxer1) == expected_score_1, f"Expected score: {expected_score_1}, got {ring_model.get_fighting_skill(sample_boxer1)}"
+
+    expected_score_2 = (220 * 10) + (71 / 10) - 1  # 220 * 10 + 7.1 - 1 = 2206.1
+    assert ring_model.get_fighting_skill(sample_boxer2) == expected_score_2, f"Expected score: {expected_score_2}, got {ring_model.get_fighting_skill(sample_boxer2)}"
+
+def test_fighting_skill_computed_once(sample_boxer1):
+    """Test that the fighting skill is stored on the boxer rather than recomputed.
+
+    """
+    assert sample_boxer1.fighting_skill is sample_boxer1.fighting_skill
+    assert "fighting_skill" not in repr(sample_boxer1), "Fighting skill should not be part of the dataclass fields."
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda boxer: pickle.loads(pickle.dumps(boxer))])
+def test_boxer_copy_and_pickle(sample_boxer1, clone):
+    """Test that copied and unpickled boxers keep every field and their fighting skill.
+
+    """
+    cloned = clone(sample_boxer1)
+
+    assert cloned == sample_boxer1
+    assert repr(cloned) == repr(sample_boxer1), "Expected every field to survive the round trip."
+    assert cloned.fighting_skill == sample_boxer1.fighting_skill
+
+def test_fight_successful(ring_model, sample_boxers, mocker):
+    """Test that a fight picks a winner and records both results with a single update.
+
+    """
+    for boxer in sample_boxers:
+        ring_model.enter_ring(boxer)
+
+    mocker.patch("boxing.models.ring_model.get_random", return_value=0.42)
+    mock_update_stats = mocker.patch("boxing.models.ring_model.update_two_boxers_stats")
+
+    winner_name = ring_model.fight()
+
+    assert winner_name == "Muhammad Ali", f"Expected boxer 1 to win, but got {winner_name}"
+
+    mock_update_stats.assert_called_once_with(1, 2)
+
+    assert ring_model.get_boxers() == [], "Ring should be empty after the fight."
+
+def test_fight_with_empty_ring(ring_model):
+    """Test that the fight method raises a ValueError when there are fewer than two boxers.
+
+    """
+    with pytest.raises(ValueError, match="There must be two boxers to start a fight."):
+        ring_model.fight()
+
+def test_fight_with_one_boxer(ring_model, sample_boxer1):
+    """Test that the fight method raises a ValueError when there's only one boxer.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+
+    with pytest.raises(ValueError, match="There must be two boxers to start a fight."):
+        ring_model.fight()
@@ -0,0 +1,94 @@
+import sqlite3
+
+import pytest
+
+from boxing.utils import sql_pool
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "boxing.db")
+
+
+def test_connect_applies_pragmas(db_path):
+    """Test that new connections use WAL with synchronous=NORMAL and in-memory temp storage.
+
+    """
+    conn = sql_pool._connect(db_path)
+
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    finally:
+        conn.close()
+
+
+def test_acquire_reuses_connections(db_path, fresh_pool):
+    """Test that the writer is reused and readers are handed out most-recently-used first.
+
+    """
+    with sql_pool.acquire(db_path) as writer:
+        pass
+    with sql_pool.acquire(db_path) as writer_again:
+        pass
+
+    assert writer is writer_again, "Expected the single writer connection to be reused."
+
+    with sql_pool.acquire(db_path, readonly=True) as reader:
+        pass
+    with sql_pool.acquire(db_path, readonly=True) as reader_again:
+        pass
+
+    assert reader is reader_again, "Expected the most recently used reader to be handed out again."
+    assert reader is not writer, "Expected readers and the writer to be separate connections."
+
+
+def test_acquire_rolls_back_open_transaction(db_path, fresh_pool):
+    """Test that a connection returned mid-transaction is rolled back before it is reused.
+
+    """
+    with sql_pool.acquire(db_path) as conn:
+        conn.execute("CREATE TABLE boxers (id INTEGER PRIMARY KEY, name TEXT)")
+
+    with pytest.raises(RuntimeError):
+        with sql_pool.acquire(db_path) as conn:
+            conn.execute("INSERT INTO boxers (name) VALUES ('Boxer One')")
+            raise RuntimeError("Request failed before commit")
+
+    with sql_pool.acquire(db_path) as conn:
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM boxers").fetchone()[0] == 0
+
+
+def test_acquire_times_out_when_pool_is_exhausted(db_path, fresh_pool, monkeypatch):
+    """Test that waiting for a connection fails with an OperationalError instead of hanging.
+
+    """
+    monkeypatch.setattr(sql_pool, "POOL_TIMEOUT", 0.01)
+
+    with sql_pool.acquire(db_path):
+        with pytest.raises(sqlite3.OperationalError, match="Timed out waiting for a writer connection"):
+            with sql_pool.acquire(db_path):
+                pass
+
+    with sql_pool.acquire(db_path) as conn:
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+
+def test_close_all(db_path, fresh_pool):
+    """Test that close_all closes idle connections and the next acquire opens a new pool.
+
+    """
+    with sql_pool.acquire(db_path) as writer:
+        pass
+
+    sql_pool.close_all()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        writer.execute("SELECT 1")
+
+    with sql_pool.acquire(db_path) as new_writer:
+        assert new_writer is not writer
+        assert new_writer.execute("SELECT 1").fetchone()[0] == 1
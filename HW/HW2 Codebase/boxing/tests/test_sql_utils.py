@@ -0,0 +1,79 @@
+import os
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from boxing.utils import sql_utils
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "sql" / "init_db.sql"
+
+# The boxers table as created by the first release of init_db.sql
+OLD_SCHEMA = """
+    CREATE TABLE boxers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        weight REAL NOT NULL CHECK (weight > 0),
+        height REAL NOT NULL CHECK (height > 0),
+        reach REAL CHECK (reach > 0),
+        age INTEGER NOT NULL CHECK (age >= 18 AND age <= 40),
+        fights INTEGER DEFAULT 0 CHECK (fights >= 0),
+        wins INTEGER DEFAULT 0 CHECK (wins >= 0 AND wins <= fights)
+    );
+    CREATE UNIQUE INDEX idx_boxers_name ON boxers(name);
+    INSERT INTO boxers (name, weight, height, reach, age) VALUES ('Boxer One', 150, 70, 70.5, 25);
+    INSERT INTO boxers (name, weight, height, reach, age) VALUES ('Boxer Two', 210, 75, 78.0, 35);
+"""
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch, fresh_pool):
+    path = str(tmp_path / "boxing.db")
+    monkeypatch.setattr(sql_utils, "DB_PATH", path)
+    return path
+
+
+def test_migrate_database_adds_weight_class(db_path):
+    """Test that a database created before weight_class existed gains the column and indexes.
+
+    """
+    conn = sqlite3.connect(db_path)
+    conn.executescript(OLD_SCHEMA)
+    conn.close()
+
+    sql_utils.migrate_database()
+    sql_utils.migrate_database()  # Running again must be a no-op
+
+    with sql_utils.get_db_connection() as conn:
+        rows = conn.execute("SELECT name, weight_class FROM boxers ORDER BY id").fetchall()
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+    assert rows == [("Boxer One", "LIGHTWEIGHT"), ("Boxer Two", "HEAVYWEIGHT")]
+    assert {"idx_boxers_leader_wins", "idx_boxers_leader_pct"} <= indexes
+    assert "idx_boxers_name" not in indexes
+
+
+def test_migrate_database_current_schema(db_path):
+    """Test that a database created from the current init_db.sql is left unchanged.
+
+    """
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA_PATH.read_text())
+    conn.close()
+
+    sql_utils.migrate_database()
+
+    with sql_utils.get_db_connection() as conn:
+        columns = {row[1]: row[6] for row in conn.execute("PRAGMA table_xinfo(boxers)")}
+
+    assert columns["weight_class"] == 3, "Expected the STORED generated column to be kept."
+
+
+def test_migrate_database_missing_database(db_path):
+    """Test that nothing is created when the database doesn't exist yet.
+
+    """
+    sql_utils.migrate_database()
+
+    assert not os.path.exists(db_path)